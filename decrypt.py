@@ -5,8 +5,11 @@ from os.path import isfile
 from cryptography.fernet import Fernet
 from loguru import logger
 
+UNLOCK_DATE = time.strptime("13 9 2021", "%d %m %Y") #Set your date here
+
 def load_key(keyfile):
-    return open(f'{keyfile}', 'rb').read()
+    with open(keyfile, 'rb') as key_file:
+        return key_file.read()
 
 
 def decrypt(key):
@@ -21,23 +24,13 @@ def decrypt(key):
 ### CHECKER FUNC ###
 def timeChecker():
     loc = time.localtime()
-    obj = time.strptime("13 9 2021", "%d %m %Y") #Set your date here
-    nd = (obj.tm_mday, obj.tm_mon, obj.tm_year)
-    now = (loc.tm_mday, loc.tm_mon, loc.tm_year)
-    lst = list(zip(now, nd))
-    if lst[2][0]>lst[2][1]:
-       logger.debug("YEAR is valid, decrypting!")
-       return True
-    else:
-        if lst[1][0]>lst[1][1]:
-            logger.debug("MOUNTH is valid, decrypting!")
-            return True
-        elif lst[1][0] == lst[1][1] and lst[0][0]>=lst[0][1]:
-            logger.debug("Mounth of day is valid, decrypting!")
-            return True
-        else:
-            logger.error("Invalid date!")
-            return False
+    nd = (UNLOCK_DATE.tm_year, UNLOCK_DATE.tm_mon, UNLOCK_DATE.tm_mday)
+    now = (loc.tm_year, loc.tm_mon, loc.tm_mday)
+    if now >= nd:
+        logger.debug("Date is valid, decrypting!")
+        return True
+    logger.error("Invalid date!")
+    return False
 
 #FILE 
 try:
@@ -46,16 +39,18 @@ try:
         print("It`s not a file babe")
         exit()
 except IndexError as IE:
-    print("print usage")
+    print("Usage: python3 decrypt.py <file> <key-file>")
+    exit()
 
 #KEY
 try:
     keyfile = sys.argv[2]
     if not isfile(keyfile):
         print("It`s not a key babe")
-
+        exit()
 except IndexError as IE:
     print("Give me a key-file!")
+    exit()
 
 if timeChecker() == True:
     key = load_key(keyfile)
@@ -19,7 +19,8 @@ def write_key(keyfilename:str):
         key_file.write(key)
 
 def load_key(keyfile):
-    return open(f'{keyfile}', 'rb').read()
+    with open(keyfile, 'rb') as key_file:
+        return key_file.read()
 
 def encrypt(key):
     f = Fernet(key)